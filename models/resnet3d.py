@@ -19,7 +19,7 @@ def _load_pretrained_weights(
         num_channels: int = 1
     ) -> None:
 
-    weights_dict = torch.load(weights_path, map_location='cpu')
+    weights_dict = torch.load(weights_path, map_location='cpu', weights_only=True)
     weights_dict = {k.replace('module.', ''): v for k, v in weights_dict['state_dict'].items()}
     model_dict = model.state_dict()
     if num_channels > 1:
@@ -41,6 +41,7 @@ class Pretrainer:
             scheduler: List[np.array],
             num_steps: int = 1000,
             amp: bool = True,
+            bf16: bool = False,
             suffix: str | None = None,
             output_dir: str | None = None
         ) -> None:
@@ -54,6 +55,7 @@ class Pretrainer:
             scheduler (List[np.array]): List of learing rate, weight decay, and momentum schedules. Has to be of length 2 or 3.
             num_steps (int): Number of training steps. Defaults to 1000.
             amp (bool): Boolean flag to enable automatic mixed precision training. Defaults to true.
+            bf16 (bool): Boolean flag to run automatic mixed precision in bfloat16 instead of float16. Requires amp. Defaults to false.
             suffix (str | None): Unique string under which model results are stored.
             output_dir (str | None): Directory to store model outputs.
         '''
@@ -70,13 +72,14 @@ class Pretrainer:
         self.num_steps = num_steps
         self.num_folds = 1
         self.amp = amp
+        self.amp_dtype = torch.bfloat16 if bf16 else torch.float16
         self.suffix = suffix
         if self.suffix is None:
             raise ValueError('Please specify a unique suffix for results storage.')
         self.output_dir = output_dir
         if self.output_dir is None:
             raise ValueError('Please specify a path to the data directory.')
-        self.scaler = GradScaler(enabled=amp)
+        self.scaler = GradScaler(enabled=amp and not bf16)
 
         if isinstance(loss_fn, list):
             self.loss_fn = loss_fn[0].to(self.gpu_id)
@@ -173,7 +176,7 @@ class Pretrainer:
         gv1, gv2, lv1, lv2 = batch['gv1'], batch['gv2'], batch['lv1'], batch['lv2']
         views = [view.to(self.gpu_id) for view in [gv1, gv2, lv1, lv2]]
 
-        with autocast(enabled=self.amp):
+        with autocast(enabled=self.amp, dtype=self.amp_dtype):
             student_logits = self.student(views)
             teacher_logits = self.teacher(views[:2])
             loss = self.loss_fn(step, student_logits, teacher_logits)
@@ -198,7 +201,7 @@ class Pretrainer:
         self.model.train()
         inputs, _, delta, padding_mask = prep_batch(batch, batch_size=batch_size, device=self.gpu_id, pretrain=True)
 
-        with autocast(enabled=self.amp):
+        with autocast(enabled=self.amp, dtype=self.amp_dtype):
             logits, labels = self.model(inputs, pad_mask=padding_mask, pos=delta)
             loss = self.loss_fn(logits.squeeze(-1), labels.float())
             loss /= accum_steps
@@ -380,7 +383,7 @@ def load_weights(
         weights_path (str): Path to weights directory.
     '''
 
-    weights = torch.load(weights_path, map_location='cpu')
+    weights = torch.load(weights_path, map_location='cpu', weights_only=True)
     weights['backbone.downsample_layers.0.0.weight'] = weights['backbone.downsample_layers.0.0.weight'].repeat(1, len(args.mod_list), 1, 1, 1)
     return weights
 
@@ -435,8 +438,7 @@ def main(
             student = nn.parallel.DistributedDataParallel(student, device_ids=[device_id])
             teacher = nn.parallel.DistributedDataParallel(teacher, device_ids=[device_id])
         teacher.load_state_dict(student.state_dict())
-        for p in teacher.parameters():
-            p.requires_grad = False
+        teacher.requires_grad_(False)
         loss_fn, optimizer, schedules = load_objs(args, student, learning_rate)
         model = [student, teacher]
     else:
@@ -452,8 +454,7 @@ def main(
         weights = load_weights(args, os.path.join(args.results_dir, f'model_weights/weights_fold32000_{modality}_{args.arch}.pth'))
         model.load_state_dict(weights, strict=False)
         model = model.to(device_id)
-        for p in model.backbone.parameters():
-            p.requires_grad = False
+        model.backbone.requires_grad_(False)
         if args.distributed:
             model = nn.parallel.DistributedDataParallel(model, device_ids=[device_id])
         loss_fn, optimizer, schedules = load_objs(args, model, learning_rate, pos_weight=None)
@@ -466,6 +467,7 @@ def main(
         scheduler=schedules,
         num_steps=args.num_steps,
         amp=args.amp,
+        bf16=args.bf16,
         suffix=args.suffix,
         output_dir=args.results_dir)
 
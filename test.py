@@ -39,6 +39,7 @@ class Tester:
             num_folds: int = 5,
             max_delta: int = 3,
             amp: bool = True,
+            bf16: bool = False,
             suffix: str | None = None,
             output_dir: str | None = None
             ) -> None:
@@ -49,6 +50,7 @@ class Tester:
             dataloaders (dict): Dataloader objects. Have to be provided as a dictionary, where the the entries are 'train' and 'val'. 
             num_folds (int): Number of cross-validation folds. Defaults to 5.
             amp (bool): Boolean flag to enable automatic mixed precision training. Defaults to true.
+            bf16 (bool): Boolean flag to run automatic mixed precision in bfloat16 instead of float16. Requires amp. Defaults to false.
             suffix (str | None): Unique string under which model results are stored.
             output_dir (str | None): Directory to store model outputs.
         '''
@@ -58,10 +60,11 @@ class Tester:
         self.num_folds = num_folds
         self.max_delta = max_delta
         self.amp = amp
+        self.amp_dtype = torch.bfloat16 if bf16 else torch.float16
         self.suffix = suffix
         self.output_dir = output_dir
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def test_step(
             self,
             batch: dict
@@ -75,7 +78,7 @@ class Tester:
         self.model.eval()
         inputs, labels, delta, padding_mask = prep_batch(batch, batch_size=1, device=self.gpu_id)
 
-        with autocast(enabled=self.amp):
+        with autocast(enabled=self.amp, dtype=self.amp_dtype):
             logits = self.model(inputs, pad_mask=padding_mask, pos=delta)
 
         probs = F.sigmoid(logits.squeeze(-1))
@@ -243,7 +246,7 @@ def load_weights(
         weights_path (str): Path to weights directory.
     '''
 
-    weights = torch.load(weights_path, map_location='cpu')
+    weights = torch.load(weights_path, map_location='cpu', weights_only=True)
     return weights
 
 def setup() -> None:
@@ -308,6 +311,7 @@ def main(
                     num_folds=k,
                     max_delta=args.max_delta,
                     amp=args.amp,
+                    bf16=args.bf16,
                     suffix=f'{modality}_{arch}_{suffix}_{args.max_delta}months',
                     output_dir=args.results_dir)
                 tester.test(fold=k)
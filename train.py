@@ -38,6 +38,7 @@ class Trainer:
             num_folds: int = 1,
             num_steps: int = 1000,
             amp: bool = True,
+            bf16: bool = False,
             suffix: str | None = None,
             output_dir: str | None = None
         ) -> None:
@@ -52,6 +53,7 @@ class Trainer:
             num_folds (int): Number of cross-validation folds. Defaults to 1.
             num_steps (int): Number of training steps. Defaults to 1000.
             amp (bool): Boolean flag to enable automatic mixed precision training. Defaults to true.
+            bf16 (bool): Boolean flag to run automatic mixed precision in bfloat16 instead of float16. Requires amp. Defaults to false.
             suffix (str | None): Unique string under which model results are stored.
             output_dir (str | None): Directory to store model outputs.
         '''
@@ -61,13 +63,14 @@ class Trainer:
         self.num_folds = num_folds
         self.num_steps = num_steps
         self.amp = amp
+        self.amp_dtype = torch.bfloat16 if bf16 else torch.float16
         self.suffix = suffix
         if self.suffix is None:
             raise ValueError('Please specify a unique suffix for results storage.')
         self.output_dir = output_dir
         if self.output_dir is None:
             raise ValueError('Please specify a path to the data directory.')
-        self.scaler = GradScaler(enabled=amp)
+        self.scaler = GradScaler(enabled=amp and not bf16)
 
         self.train_loss = loss_fn[0].to(self.gpu_id)
         self.val_loss = loss_fn[1].to(self.gpu_id)
@@ -157,7 +160,7 @@ class Trainer:
         self.model.train()
         inputs, labels, delta, padding_mask = prep_batch(batch, batch_size=batch_size, device=self.gpu_id)
 
-        with autocast(enabled=self.amp):
+        with autocast(enabled=self.amp, dtype=self.amp_dtype):
             logits = self.model(inputs, pad_mask=padding_mask, pos=delta)
             loss = self.train_loss(logits.squeeze(-1), labels.float())
             loss /= accum_steps
@@ -192,7 +195,7 @@ class Trainer:
         self.scaler.update()
         self.optim.zero_grad(set_to_none=True)
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def validation_step(
             self, 
             batch: dict,
@@ -208,7 +211,7 @@ class Trainer:
         self.model.eval()
         inputs, labels, delta, padding_mask = prep_batch(batch, batch_size=batch_size, device=self.gpu_id)
 
-        with autocast(enabled=self.amp):
+        with autocast(enabled=self.amp, dtype=self.amp_dtype):
             logits = self.model(inputs, pad_mask=padding_mask, pos=delta)
             loss = self.val_loss(logits.squeeze(-1), labels.float())
 
@@ -356,7 +359,7 @@ def load_weights(
         weights_path (str): Path to weights directory.
     '''
 
-    weights = torch.load(weights_path, map_location='cpu')
+    weights = torch.load(weights_path, map_location='cpu', weights_only=True)
     weights['backbone.downsample_layers.0.0.weight'] = weights['backbone.downsample_layers.0.0.weight'].repeat(1, len(args.mod_list), 1, 1, 1)
     return weights
 
@@ -422,7 +425,7 @@ def main(
                     weights = load_weights(args, os.path.join(args.results_dir, f'model_weights/weights_fold32000_{modality}_{args.arch}.pth'))
                     model.load_state_dict(weights, strict=False)
                 else:
-                    weights = torch.load(weights_path, map_location='cpu')
+                    weights = torch.load(weights_path, map_location='cpu', weights_only=True)
                     model.load_state_dict(weights)
             model = model.to(device_id)
             if args.distributed:
@@ -441,6 +444,7 @@ def main(
                 num_folds=int(num_folds * args.num_seeds),
                 num_steps=args.num_steps,
                 amp=args.amp,
+                bf16=args.bf16,
                 suffix=args.suffix,
                 output_dir=args.results_dir)
             trainer.train(
@@ -30,6 +30,8 @@ def parse_args() -> argparse.Namespace:
                         help="Whether to enable distributed training.")
     parser.add_argument("--amp", action='store_true',
                         help="Whether to enable automated mixed precision training.")
+    parser.add_argument("--bf16", action='store_true',
+                        help="Whether to use bfloat16 instead of float16 for automated mixed precision. Requires --amp.")
     parser.add_argument("--pretrained", action='store_true',
                         help="Flag to use pretrained weights.")
     parser.add_argument("--partial", action='store_true',
@@ -96,7 +98,10 @@ def parse_args() -> argparse.Namespace:
                         help="Path to results directory")
     parser.add_argument("--weights-dir", default=WEIGHTS_DIR, type=str, 
                         help="Path to weights directory")
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.bf16 and not args.amp:
+        parser.error('--bf16 requires --amp')
+    return args
 
 RESULTS_DIR = '/Users/noltinho/thesis/results'
 DATA_DIR = '/Users/noltinho/thesis/sensitive_data'
@@ -34,6 +34,14 @@ from losses.focalloss import FocalLoss
 from losses.binaryceloss import BinaryCELoss
 from losses.dinoloss import DINOLoss
 
+_CONVNEXT_FNS = {
+    'atto': convnext3d_atto,
+    'femto': convnext3d_femto,
+    'pico': convnext3d_pico,
+    'nano': convnext3d_nano,
+    'tiny': convnext3d_tiny
+}
+
 def load_backbone(
         args: argparse.Namespace,
         arch: str,
@@ -48,32 +56,15 @@ def load_backbone(
 
     in_chans = 1 if dino_pretraining else len(args.mod_list)
 
-    if arch == 'atto':
-        student = convnext3d_atto(
-            in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
-        teacher = convnext3d_atto(
-            in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
-    elif arch == 'femto':
-        student = convnext3d_femto(
-            in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
-        teacher = convnext3d_femto(
-            in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
-    elif arch == 'pico':
-        student = convnext3d_pico(
-            in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
-        teacher = convnext3d_pico(
-            in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
-    elif arch == 'nano':
-        student = convnext3d_nano(
-            in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
-        teacher = convnext3d_nano(
-            in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
-    elif arch == 'tiny':
-        student = convnext3d_tiny(
-            in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
-        teacher = convnext3d_tiny(
-            in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
-    
+    try:
+        model_fn = _CONVNEXT_FNS[arch]
+    except KeyError:
+        raise ValueError(f'Invalid architecture: {arch}. Please choose from: {", ".join(_CONVNEXT_FNS)}.') from None
+    student = model_fn(
+        in_chans=in_chans, kernel_size=args.kernel_size, drop_path_rate=args.stochastic_depth, use_v2=args.use_v2, eps=args.epsilon)
+    teacher = model_fn(
+        in_chans=in_chans, kernel_size=args.kernel_size, use_v2=args.use_v2, eps=args.epsilon)
+
     if dino_pretraining:
         return student, teacher
     else: